@@ -10,6 +10,7 @@ www.linkedin.com/in/eng-mostafa-maher
 
 Requirements:
     pip install pandas openpyxl
+    pip install python-calamine   (optional, faster Excel loading)
 
 Usage:
     1. Place this script next to 'CDMP Practice Exam v4.xlsx'
@@ -17,22 +18,40 @@ Usage:
 ================================================================================
 """
 
+import hashlib
 import os
-import sys
+import pickle
+import threading
 import time
-import re
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 import tkinter as tk
-from tkinter import ttk, messagebox
-import pandas as pd
+from tkinter import ttk, messagebox, font as tkfont
+
+# numpy/pandas dominate start-up time, so they are imported on first use: every
+# function (and the app class) that uses np/pd calls load_data_libraries() first.
+# A missing workbook is then reported without ever loading them.
+np = pd = None
 
 # ============================================================================
 # CONFIGURATION SECTION
 # ============================================================================
 
 EXCEL_FILE = "CDMP Practice Exam.xlsx"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+EXCEL_PATH = os.path.join(SCRIPT_DIR, EXCEL_FILE)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cdmp_cache")
+CACHE_VERSION = 1  # bump whenever the parsed/normalized frames change shape
 SECONDS_PER_QUESTION = 30
 AUTO_ADVANCE_DELAY = 700
 
+GREETING_LINES = ("بسم الله الرحمن الرحيم",
+                  "صلى الله على النبي محمد عليه أفضل الصلاة والسلام",
+                  "وادعو لي لو استفدت من البرنامج")
+GREETING_TEXT = "\n\n".join(GREETING_LINES)
+GREETING_BANNER = "\n".join(GREETING_LINES)
+
 CHAPTERS = {
     "1": "Data Management",
     "2": "Data Governance",
@@ -51,63 +70,152 @@ CHAPTERS = {
     "15": "Document and Content Management",
 }
 
+CHAPTERS_BY_INT = MappingProxyType({int(key): name for key, name in CHAPTERS.items()})
+CHAPTER_NAMES = frozenset(CHAPTERS.values())
+
+# Every canonical spelling (chapter number or name) mapped to its chapter name.
+CHAPTER_LOOKUP = {**CHAPTERS, **{name: name for name in CHAPTER_NAMES}}
+
+# Accepted header spellings for each field of the single-sheet format
+COMBINED_COLUMNS = {
+    'chapter': ['KnowledgeArea', 'Knowledge Area', 'knowledgearea'],
+    'qnum': ['Question Number', 'QuestionNumber', 'QNumber'],
+    'question': ['Question', 'question'],
+    'correct': ['Correct', 'correct', 'Answer'],
+    'section': ['DMBOK Section', 'DMBOKSection'],
+    'page': ['DMBOK Page', 'DMBOKPage'],
+    **{letter: [letter, f'{letter}.', letter.lower()] for letter in ['A', 'B', 'C', 'D', 'E']},
+}
+COMBINED_HEADERS = frozenset(v.lower() for variants in COMBINED_COLUMNS.values() for v in variants)
+
+# Columns the app reads from the two-sheet format ('ques' and 'ans' sheets)
+QUES_COLUMNS = frozenset(['qid', 'chapter', 'question', 'type'])
+ANS_COLUMNS = frozenset(['qid', 'options', 'value', 'point', 'randomize', 'ref'])
+
+# Answer separators collapse to spaces so str.split() can tokenize the cell.
+_SEP_TRANS = str.maketrans(',;/', '   ')
+
+# Byte table: A-E/a-e map to upper-case A-E, every other byte maps to NUL.
+_LETTER_MAP = bytes((c & 0xDF) if c in b'ABCDEabcde' else 0 for c in range(256))
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def set_working_directory():
-    """Set working directory to script location."""
+def load_data_libraries():
+    """Import numpy and pandas on first use."""
+    global np, pd
+    if pd is None:
+        import numpy as np
+        import pandas as pd
+
+def is_missing(value):
+    """Return True for empty cells (None, NaN, NaT, pd.NA) without calling into pandas."""
+    if value is None:
+        return True
     try:
-        script_path = os.path.abspath(sys.argv[0])
-        directory = os.path.dirname(script_path)
-        if directory:
-            os.chdir(directory)
-    except:
-        pass
+        return bool(value != value)
+    except TypeError:
+        # pd.NA cannot be coerced to bool
+        return True
 
+@lru_cache(maxsize=None, typed=True)
 def normalize_chapter_name(value):
     """Convert chapter identifiers to standard names."""
-    if pd.isna(value) or str(value).strip() == "":
+    if isinstance(value, str):
+        return normalize_chapter_text(value)
+    if is_missing(value):
+        return "Unspecified"
+    if isinstance(value, (int, float)):
+        if float(value).is_integer():
+            return CHAPTERS_BY_INT.get(int(value), str(value))
+        return str(value)
+    return normalize_chapter_text(str(value))
+
+@lru_cache(maxsize=None)
+def normalize_chapter_text(value):
+    """Convert a chapter identifier that is already text to its standard name."""
+    name = value.strip()
+    if not name:
         return "Unspecified"
+    if name in CHAPTER_LOOKUP:
+        return CHAPTER_LOOKUP[name]
     
-    try:
-        num = float(value)
+    # Numeric text such as "03" or "4.0" only needs float() once it looks numeric
+    if name.replace('.', '', 1).isdecimal():
+        num = float(name)
         if num.is_integer():
-            key = str(int(num))
-            if key in CHAPTERS:
-                return CHAPTERS[key]
-    except:
-        pass
+            return CHAPTERS_BY_INT.get(int(num), name)
     
-    if value in CHAPTERS.values():
-        return value
-    
-    return str(value).strip()
+    return name
 
-def extract_correct_letters(text):
-    """Extract correct answer letters (A-E) from text."""
-    if pd.isna(text):
-        return []
+def scan_answer_letters(text):
+    """Scan an answer cell into upper-case A-E bytes (may contain repeats)."""
+    if is_missing(text):
+        return b''
     
-    items = re.split(r'[,;/\s]+', str(text).strip())
-    letters = []
+    # Only the first character of each token counts ("C", "c)", "E.").
+    heads = "".join(item[0] for item in str(text).translate(_SEP_TRANS).split())
+    return heads.encode('ascii', 'ignore').translate(_LETTER_MAP).replace(b'\x00', b'')
+
+@lru_cache(maxsize=None)
+def extract_correct_bits(text):
+    """Encode correct answer letters (A-E) as a bitmask (bit 0 = A)."""
+    mask = 0
+    for code in scan_answer_letters(text):
+        mask |= 1 << (code - 65)
+    return mask
+
+def format_timer(seconds):
+    """Format remaining seconds as the timer label text."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"Time: {minutes:02d}:{seconds:02d}"
+
+def normalize_chapter_series(series):
+    """Normalize a whole chapter column, falling back per value only on misses."""
+    values = series.fillna('').astype(str)
+    chapters = values.map(CHAPTER_LOOKUP)
     
-    for item in items:
-        match = re.match(r'([A-Ea-e])', item)
-        if match:
-            letters.append(match.group(1).upper())
+    missing = chapters.isna()
+    if missing.any():
+        chapters = chapters.fillna(values[missing].map(normalize_chapter_text))
     
-    return list(dict.fromkeys(letters))
+    return chapters
 
 # ============================================================================
 # MAIN APPLICATION CLASS
 # ============================================================================
 
+# Display data for one question of a quiz session, built once at quiz start
+RenderedQuestion = namedtuple('RenderedQuestion', ['qid', 'qtype', 'text'])
+
+# Everything a quiz session needs, assembled off the Tk thread
+PreparedQuiz = namedtuple('PreparedQuiz', ['chapter', 'questions', 'answer_rows',
+                                           'correct_by_qid', 'rendered_questions'])
+
+# One answer option as shown on screen; tuples carry no per-instance __dict__
+AnswerOption = namedtuple('AnswerOption', ['value', 'key', 'texts', 'is_correct'])
+NO_OPTION = AnswerOption(None, 'None', ('', '', '', ''), False)
+
+# How an option is marked: indices into AnswerOption.texts and ANSWER_COLORS
+SHOWN, REVEALED, MARKED_CORRECT, MARKED_WRONG = range(4)
+ANSWER_COLORS = (None, None, 'lightgreen', 'lightcoral')
+
+def make_answer_option(value, option, ref, point):
+    """Build an answer option with every display text it can take."""
+    text = str(option).strip()
+    ref = str(ref).strip()
+    suffix = f"  → {ref}" if ref else ""
+    texts = (text, text + suffix, f"{text}  ✓ (Correct){suffix}", f"{text}  ✘ (Your Answer){suffix}")
+    return AnswerOption(value, str(value), texts, int(point) == 1)
+
 class CDMPQuizApp:
     """Main quiz application class."""
     
-    def __init__(self, master, questions_df, answers_df):
+    def __init__(self, master, questions_df, answers_df, answer_rows_by_qid=None):
         """Initialize the quiz application."""
+        load_data_libraries()
+        
         self.master = master
         self.master.title("CDMP Quiz Application")
         self.master.geometry("980x720")
@@ -115,8 +223,21 @@ class CDMPQuizApp:
         self.all_questions = questions_df.copy().reset_index(drop=True)
         self.all_answers = answers_df.copy().reset_index(drop=True)
         
+        # Row positions per chapter, built once so chapter lookups are a dict hit
+        self._chapter_idx = self.all_questions.groupby('chapter', sort=False, observed=True).indices
+        self._chapter_counts = {ch: len(rows) for ch, rows in self._chapter_idx.items()}
+        
+        # Answer row positions per question, so quiz setup never scans the whole answer table
+        self._no_answers = np.empty(0, dtype=np.intp)
+        if answer_rows_by_qid is None:
+            answer_rows_by_qid = group_answer_rows(self.all_answers)
+        self._answer_idx_by_qid = answer_rows_by_qid
+        self._qids_unique = self.all_questions['qid'].is_unique
+        self._answer_rows = {}
+        self._correct_by_qid = {}
+        
         self.questions = pd.DataFrame()
-        self.answers = pd.DataFrame()
+        self.rendered_questions = []
         
         self.active = False
         self.review_mode = False
@@ -124,28 +245,35 @@ class CDMPQuizApp:
         self.timer_expired = False
         self.start_time = None
         self.total_time = 0
+        self._timer_text = format_timer(0)
         
         self.current_index = 0
         self.current_question_idx = None
+        self.current_question = None
         self.question_start_time = None
+        self._advance_id = None
         
         self.user_answers = []
+        self._user_answers_by_qid = {}
         
         self.answer_widgets = []
         self.selected_radio = tk.StringVar(value='NONE')
         self.selected_checkboxes = []
         
+        # Answer widgets are created on first use and reconfigured afterwards
+        self._radio_pool = []
+        self._check_pool = []
+        self._empty_answers_label = None
+        
+        # Shared answer font, resolved by Tk once instead of per option widget
+        self.answer_font = tkfont.Font(family="Helvetica", size=14)
+        
         self.create_interface()
         self.show_greeting()
     
     def show_greeting(self):
         """Display Islamic greeting popup."""
-        greeting = """بسم الله الرحمن الرحيم
-
-صلى الله على النبي محمد عليه أفضل الصلاة والسلام
-
-وادعو لي لو استفدت من البرنامج"""
-        messagebox.showinfo("بركة", greeting)
+        messagebox.showinfo("بركة", GREETING_TEXT)
     
     def create_interface(self):
         """Build the main user interface."""
@@ -162,11 +290,7 @@ class CDMPQuizApp:
         greeting_box = tk.Frame(self.start_frame, bg="#f0f8ff", relief="ridge", borderwidth=2)
         greeting_box.grid(row=0, column=0, columnspan=3, sticky='ew', pady=(0, 15))
         
-        greeting_text = ("بسم الله الرحمن الرحيم\n"
-                        "صلى الله على النبي محمد عليه أفضل الصلاة والسلام\n"
-                        "وادعو لي لو استفدت من البرنامج")
-        
-        tk.Label(greeting_box, text=greeting_text, font=("Arial", 11),
+        tk.Label(greeting_box, text=GREETING_BANNER, font=("Arial", 11),
                 bg="#f0f8ff", fg="#1a5490", justify='center', pady=10).pack()
         
         tk.Label(self.start_frame, text="CDMP Quiz Application",
@@ -193,8 +317,9 @@ class CDMPQuizApp:
         tk.Checkbutton(self.start_frame, text="Randomize Answer Order",
                       variable=self.randomize_answers).grid(row=4, column=0, columnspan=3, sticky='w')
         
-        tk.Button(self.start_frame, text="Start Quiz", width=16, bg="#4caf50", fg="white",
-                 command=self.start_quiz).grid(row=2, column=2, rowspan=2, padx=(6, 0))
+        self.start_btn = tk.Button(self.start_frame, text="Start Quiz", width=16, bg="#4caf50",
+                                   fg="white", command=self.start_quiz)
+        self.start_btn.grid(row=2, column=2, rowspan=2, padx=(6, 0))
         
         self.info_label = tk.Label(self.start_frame, text="", fg="gray", font=("Helvetica", 10))
         self.info_label.grid(row=5, column=0, columnspan=3, pady=(12, 0), sticky='w')
@@ -205,7 +330,7 @@ class CDMPQuizApp:
         topbar = tk.Frame(self.quiz_frame)
         topbar.pack(fill='x', pady=(4, 6))
         
-        self.timer_label = tk.Label(topbar, text="Time: 00:00", font=("Helvetica", 12))
+        self.timer_label = tk.Label(topbar, text=format_timer(0), font=("Helvetica", 12))
         self.timer_label.pack(side='left')
         
         tk.Button(topbar, text="End Quiz", bg="#d9534f", fg="white",
@@ -230,6 +355,12 @@ class CDMPQuizApp:
         self.answers_container = tk.Frame(self.quiz_frame)
         self.answers_container.pack(fill='both', expand=True, anchor='nw')
         
+        # Answer text wraps to the container; resizes are coalesced into one update
+        self._wraplength = 900
+        self._container_width = None
+        self._wrap_pending = None
+        self.answers_container.bind("<Configure>", self.on_answers_resize)
+        
         nav_frame = tk.Frame(self.quiz_frame)
         nav_frame.pack(fill='x', pady=(8, 6))
         
@@ -249,7 +380,11 @@ class CDMPQuizApp:
         self.status_label = tk.Label(self.quiz_frame, text="", font=("Helvetica", 11))
         self.status_label.pack(anchor='w', pady=(6, 0))
         
-        self.master.bind("<Key>", self.handle_keypress)
+        # Bind only the digit keys so other keystrokes never reach Python
+        for number in range(1, 10):
+            handler = lambda e, idx=number - 1: self.select_answer(idx)
+            self.master.bind(f"<Key-{number}>", handler)
+            self.master.bind(f"<KP_{number}>", handler)
     
     def get_chapter_list(self):
         """Get list of chapters for dropdown."""
@@ -267,6 +402,10 @@ class CDMPQuizApp:
             return selection.split(" - ", 1)[1].strip()
         return selection
     
+    def get_chapter_rows(self, chapter):
+        """Get positional indices of the questions in a chapter."""
+        return self._chapter_idx.get(chapter, np.empty(0, dtype=np.intp))
+    
     def update_chapter_info(self):
         """Update the chapter info display."""
         chapter = self.get_selected_chapter()
@@ -275,7 +414,7 @@ class CDMPQuizApp:
             count = len(self.all_questions)
             display = "All Chapters"
         else:
-            count = len(self.all_questions[self.all_questions['chapter'] == chapter])
+            count = self._chapter_counts.get(chapter, 0)
             display = chapter
         
         self.info_label.config(text=f"Chapter: {display}   |   Questions: {count}")
@@ -285,34 +424,90 @@ class CDMPQuizApp:
         chapter = self.get_selected_chapter()
         
         if chapter == "All Chapters":
-            questions = self.all_questions.copy().reset_index(drop=True)
+            rows = np.arange(len(self.all_questions))
         else:
-            questions = self.all_questions[self.all_questions['chapter'] == chapter].copy().reset_index(drop=True)
+            rows = self.get_chapter_rows(chapter)
         
-        if questions.empty:
+        if len(rows) == 0:
             messagebox.showwarning("No Questions", f"No questions found for: {chapter}")
             return
         
+        # Shuffle the row positions, not the frame, then gather once
         if self.randomize_questions.get() == 1:
-            questions = questions.sample(frac=1).reset_index(drop=True)
+            rows = np.random.permutation(rows)
+        
+        # Tk variables are read here; the pandas work runs on a worker thread
+        shuffle_answers = self.randomize_answers.get() == 1
+        self.start_btn.config(state='disabled', text="Preparing…")
+        threading.Thread(target=self.prepare_quiz_in_background,
+                         args=(chapter, rows, shuffle_answers), daemon=True).start()
+    
+    def prepare_quiz_in_background(self, chapter, rows, shuffle_answers):
+        """Prepare a quiz on a worker thread and hand the result to the Tk thread."""
+        try:
+            prepared = self.prepare_quiz(chapter, rows, shuffle_answers)
+        except Exception as e:
+            self.master.after(0, self.prepare_quiz_failed, e)
+        else:
+            self.master.after(0, self.begin_quiz, prepared)
+    
+    def prepare_quiz_failed(self, error):
+        """Report a quiz that could not be prepared."""
+        self.start_btn.config(state='normal', text="Start Quiz")
+        messagebox.showerror("Quiz Error", str(error))
+    
+    def prepare_quiz(self, chapter, rows, shuffle_answers):
+        """Assemble the questions and answers of a quiz (no Tk calls)."""
+        questions = self.all_questions.take(rows).reset_index(drop=True)
         
-        question_ids = questions['qid'].unique()
-        answer_frames = []
+        # Qids are checked for duplicates once at startup; only dedupe when needed
+        qids = questions['qid'].to_numpy()
+        question_ids = qids if self._qids_unique else pd.unique(qids)
+        answer_rows = []
         
         for qid in question_ids:
-            qanswers = self.all_answers[self.all_answers['qid'] == qid].copy().reset_index(drop=True)
+            idx = self._answer_idx_by_qid.get(qid, self._no_answers)
             
-            if self.randomize_answers.get() == 1:
-                qanswers = qanswers.sample(frac=1).reset_index(drop=True)
+            if shuffle_answers:
+                idx = np.random.permutation(idx)
             
-            answer_frames.append(qanswers)
-        
-        answers = pd.concat(answer_frames, ignore_index=True) if answer_frames else pd.DataFrame()
+            answer_rows.append(idx)
+        
+        # One gather from the full answer table instead of concatenating per-question frames
+        answers = self.all_answers.take(np.concatenate(answer_rows)).reset_index(drop=True)
+        
+        # Answer options per question, stringified once instead of on every render
+        answer_rows = {}
+        if not answers.empty:
+            for qid, group in answers.groupby('qid', sort=False, observed=True):
+                answer_rows[qid] = [
+                    make_answer_option(value, option, ref, point)
+                    for value, option, ref, point in zip(group['value'], group['options'],
+                                                         group['ref'], group['point'])
+                ]
+        correct_by_qid = {}
+        if not answers.empty:
+            correct = answers[answers['point'] == 1]
+            for qid, group in correct.groupby('qid', sort=False, observed=True):
+                values = frozenset(group['value'].astype(str))
+                correct_by_qid[qid] = (values, 1.0 / len(group))
+        
+        return PreparedQuiz(chapter, questions, answer_rows, correct_by_qid,
+                            self.render_questions(questions, chapter))
+    
+    def begin_quiz(self, prepared):
+        """Install a prepared quiz and show its first question."""
+        chapter = prepared.chapter
+        questions = prepared.questions
+        self.start_btn.config(state='normal', text="Start Quiz")
         
         self.questions = questions
-        self.answers = answers
+        self._answer_rows = prepared.answer_rows
+        self._correct_by_qid = prepared.correct_by_qid
+        self.rendered_questions = prepared.rendered_questions
         
         self.user_answers = []
+        self._user_answers_by_qid = {}
         self.current_index = 0
         self.current_question_idx = None
         self.active = True
@@ -328,12 +523,25 @@ class CDMPQuizApp:
         
         self.load_next_question()
     
+    def render_questions(self, questions, chapter):
+        """Precompute the label text and metadata of every question in a session."""
+        total = len(questions)
+        qids = questions['qid'] if 'qid' in questions.columns else [''] * total
+        texts = questions['question'] if 'question' in questions.columns else [''] * total
+        qtypes = questions['type'] if 'type' in questions.columns else ['single'] * total
+        
+        rendered = []
+        for number, (qid, text, qtype) in enumerate(zip(qids, texts, qtypes), start=1):
+            header = f"Chapter: {chapter}   |   QID: {qid}   ({number} of {total})\n\n"
+            rendered.append(RenderedQuestion(qid, qtype, header + str(text)))
+        return rendered
+    
     def load_next_question(self):
         """Load and display the next question."""
         if not self.active:
             return
         
-        self.clear_answer_widgets()
+        self.cancel_auto_advance()
         self.selected_radio.set('NONE')
         self.selected_checkboxes = []
         self.submit_btn.config(state='disabled')
@@ -341,16 +549,14 @@ class CDMPQuizApp:
         self.show_answer_btn.config(state='disabled')
         
         if self.current_index < len(self.questions):
-            question = self.questions.iloc[self.current_index]
+            question = self.rendered_questions[self.current_index]
             self.current_question_idx = self.current_index
             self.current_index += 1
             
-            chapter = self.get_selected_chapter()
-            qid = question.get('qid', '')
-            header = f"Chapter: {chapter}   |   QID: {qid}   ({self.current_question_idx + 1} of {len(self.questions)})\n\n"
-            self.question_label.config(text=header + str(question.get('question', '')))
+            qid = question.qid
+            self.question_label.config(text=question.text)
             
-            self.current_metadata = {'qid': qid, 'type': question.get('type', 'single')}
+            self.current_question = question
             self.question_start_time = time.time()
             
             if not self.timer_active:
@@ -358,11 +564,12 @@ class CDMPQuizApp:
                 self.update_timer()
                 self.timer_active = True
             
-            self.display_answers(qid, question.get('type', 'single'))
+            self.display_answers(qid, question.qtype)
             
             self.skip_btn.config(state='normal')
             self.prev_btn.config(state='normal' if self.current_question_idx > 0 else 'disabled')
         else:
+            self.clear_answer_widgets()
             self.finish_quiz()
     
     def go_previous(self):
@@ -371,8 +578,9 @@ class CDMPQuizApp:
             return
         
         # Remove answer for current question if exists
-        current_qid = self.questions.iloc[self.current_question_idx]['qid']
-        self.user_answers = [ans for ans in self.user_answers if ans.get('qid') != current_qid]
+        current_qid = self.rendered_questions[self.current_question_idx].qid
+        if self._user_answers_by_qid.pop(current_qid, None):
+            self.user_answers = [ans for ans in self.user_answers if ans.get('qid') != current_qid]
         
         # Go back one question
         self.current_index = self.current_question_idx - 1
@@ -380,87 +588,121 @@ class CDMPQuizApp:
     
     def display_answers(self, qid, question_type, show_correct=False, user_response=None):
         """Display answer options for current question."""
-        self.clear_answer_widgets()
+        # Widgets already on screen stay packed; only visibility changes hit the packer
+        previous = set(self.answer_widgets)
+        self.answer_widgets = []
         
-        qanswers = self.answers[self.answers['qid'] == qid].reset_index(drop=True)
+        options = self._answer_rows.get(qid)
         
-        if qanswers.empty:
-            label = tk.Label(self.answers_container, text="(No answers available)",
-                           font=("Helvetica", 14))
-            label.pack(anchor='w', padx=8, pady=6)
+        if not options:
+            if self._empty_answers_label is None:
+                self._empty_answers_label = tk.Label(self.answers_container,
+                                                     font=self.answer_font)
+            label = self._empty_answers_label
+            label.configure(text="(No answers available)")
+            if label not in previous:
+                label.pack(anchor='w', padx=8, pady=6)
             self.answer_widgets.append(label)
+            self.hide_answer_widgets(previous)
             return
         
-        for idx, answer in qanswers.iterrows():
-            option_text = str(answer.get('options', '')).strip()
-            reference = str(answer.get('ref', '')).strip()
-            value = answer.get('value', '')
-            is_correct = int(answer.get('point', 0)) == 1
-            
+        revealed = show_correct or self.review_mode or self.timer_expired
+        state = 'disabled' if revealed else 'normal'
+        
+        # Stringify the user's response once rather than per option
+        if user_response is None:
+            chosen = frozenset()
+        elif question_type == 'single':
+            chosen = frozenset((str(user_response),))
+        elif isinstance(user_response, (list, tuple)):
+            chosen = frozenset(map(str, user_response))
+        else:
+            chosen = frozenset()
+        
+        for position, option in enumerate(options):
             # No numbering - just option text
-            display = option_text
-            
-            if show_correct or self.review_mode or self.timer_expired:
-                if is_correct:
-                    display = f"{option_text}  ✓ (Correct)"
-                elif user_response is not None:
-                    if question_type == 'single' and str(user_response) == str(value):
-                        display = f"{option_text}  ✘ (Your Answer)"
-                    elif (question_type != 'single' and isinstance(user_response, (list, tuple)) and
-                          str(value) in [str(x) for x in user_response]):
-                        display = f"{option_text}  ✘ (Your Answer)"
-                
-                if reference:
-                    display += f"  → {reference}"
-            
-            state = 'disabled' if (show_correct or self.review_mode or self.timer_expired) else 'normal'
-            bg_color = None
+            if not revealed:
+                mark = SHOWN
+            elif option.is_correct:
+                mark = MARKED_CORRECT
+            elif option.key in chosen:
+                mark = MARKED_WRONG
+            else:
+                mark = REVEALED
+            display = option.texts[mark]
+            bg_color = ANSWER_COLORS[mark]
+            value = option.value
             
-            if show_correct or self.review_mode or self.timer_expired:
-                if is_correct:
-                    bg_color = 'lightgreen'
-                elif user_response is not None:
-                    if question_type == 'single' and str(user_response) == str(value):
-                        bg_color = 'lightcoral'
-                    elif (question_type != 'single' and isinstance(user_response, (list, tuple)) and
-                          str(value) in [str(x) for x in user_response]):
-                        bg_color = 'lightcoral'
+            widget = self.get_answer_widget(question_type, position)
             
             if question_type == 'single':
-                widget = tk.Radiobutton(self.answers_container, text=display,
-                                       variable=self.selected_radio, value=value,
-                                       command=self.on_answer_selected, anchor='w',
-                                       justify='left', state=state, wraplength=900,
-                                       font=("Helvetica", 14))
+                widget.configure(text=display, value=value, state=state,
+                                 bg=bg_color or widget._default_bg)
             else:
-                var = tk.StringVar(value='')
-                widget = tk.Checkbutton(self.answers_container, text=display,
-                                       variable=var, onvalue=value, offvalue='',
-                                       command=lambda v=var: self.on_answer_selected(v),
-                                       anchor='w', justify='left', state=state,
-                                       wraplength=900, font=("Helvetica", 14))
-                self.selected_checkboxes.append(var)
-            
-            widget._value = value
-            widget._is_correct = is_correct
-            widget._option_text = option_text
-            widget._reference = reference
-            widget._index = idx
+                widget._var.set('')
+                widget.configure(text=display, onvalue=value, state=state,
+                                 bg=bg_color or widget._default_bg)
+                self.selected_checkboxes.append(widget._var)
             
-            if bg_color:
-                try:
-                    widget.configure(bg=bg_color)
-                except:
-                    pass
+            widget._option = option
             
-            widget.pack(anchor='w', padx=8, pady=4)
+            if widget not in previous:
+                widget.pack(anchor='w', padx=8, pady=4)
             self.answer_widgets.append(widget)
+        
+        self.hide_answer_widgets(previous)
+    
+    def hide_answer_widgets(self, widgets):
+        """Unpack the given widgets that are no longer part of the answer list."""
+        current = set(self.answer_widgets)
+        for widget in widgets:
+            if widget not in current:
+                widget.pack_forget()
+    
+    def get_answer_widget(self, question_type, position):
+        """Get the pooled answer widget for a position, creating it if needed."""
+        pool = self._radio_pool if question_type == 'single' else self._check_pool
+        if position < len(pool):
+            return pool[position]
+        
+        if question_type == 'single':
+            widget = tk.Radiobutton(self.answers_container, variable=self.selected_radio,
+                                   command=self.on_answer_selected, anchor='w', justify='left',
+                                   wraplength=self._wraplength, font=self.answer_font)
+        else:
+            var = tk.StringVar(value='')
+            widget = tk.Checkbutton(self.answers_container, variable=var, offvalue='',
+                                   command=lambda v=var: self.on_answer_selected(v),
+                                   anchor='w', justify='left', wraplength=self._wraplength,
+                                   font=self.answer_font)
+            widget._var = var
+        
+        widget._default_bg = widget.cget('bg')
+        pool.append(widget)
+        return widget
+    
+    def on_answers_resize(self, event):
+        """Queue a wraplength update when the answers area is resized."""
+        self._container_width = event.width
+        if self._wrap_pending is None:
+            self._wrap_pending = self.master.after_idle(self.apply_wraplength)
+    
+    def apply_wraplength(self):
+        """Rewrap the pooled answer widgets if the usable width changed."""
+        self._wrap_pending = None
+        wraplength = max(300, self._container_width - 40)
+        if wraplength == self._wraplength:
+            return
+        
+        self._wraplength = wraplength
+        for widget in self._radio_pool + self._check_pool:
+            widget.configure(wraplength=wraplength)
     
     def clear_answer_widgets(self):
-        """Remove all answer widgets from display."""
+        """Hide all answer widgets; pooled widgets are kept for reuse."""
         for widget in self.answer_widgets:
             try:
-                widget.destroy()
+                widget.pack_forget()
             except:
                 pass
         self.answer_widgets = []
@@ -485,8 +727,7 @@ class CDMPQuizApp:
         
         elapsed = int(time.time() - self.question_start_time) if self.question_start_time else 0
         
-        qid = self.current_metadata.get('qid')
-        qtype = self.current_metadata.get('type', 'single')
+        qid, qtype = self.current_question.qid, self.current_question.qtype
         
         if qtype == 'single':
             user_answer = self.selected_radio.get()
@@ -497,13 +738,15 @@ class CDMPQuizApp:
         
         points = self.calculate_points(qid, user_answer)
         
-        self.user_answers.append({
+        record = {
             'qid': qid,
             'type': qtype,
             'answer': user_answer,
             'points': points,
             'time': elapsed
-        })
+        }
+        self.user_answers.append(record)
+        self._user_answers_by_qid.setdefault(qid, []).append(record)
         
         self.update_answer_display(qid, user_answer)
         
@@ -511,7 +754,13 @@ class CDMPQuizApp:
         self.skip_btn.config(state='disabled')
         self.show_answer_btn.config(state='disabled')
         
-        self.master.after(AUTO_ADVANCE_DELAY, lambda: self.load_next_question() if self.active else None)
+        self._advance_id = self.master.after(AUTO_ADVANCE_DELAY, self.load_next_question)
+    
+    def cancel_auto_advance(self):
+        """Cancel a pending move to the next question, if any."""
+        if self._advance_id is not None:
+            self.master.after_cancel(self._advance_id)
+            self._advance_id = None
     
     def skip_question(self):
         """Skip current question without recording an answer."""
@@ -519,39 +768,26 @@ class CDMPQuizApp:
     
     def update_answer_display(self, qid, user_answer):
         """Update answer widgets to show correct/incorrect."""
+        if user_answer is None:
+            chosen = frozenset()
+        elif isinstance(user_answer, list):
+            chosen = frozenset(map(str, user_answer))
+        else:
+            chosen = frozenset((str(user_answer),))
+        
         for widget in self.answer_widgets:
-            value = getattr(widget, '_value', None)
-            is_correct = getattr(widget, '_is_correct', False)
-            option_text = getattr(widget, '_option_text', '')
-            reference = getattr(widget, '_reference', '')
-            
-            display = option_text
-            
-            if is_correct:
-                display = f"{option_text}  ✓ (Correct)"
-            elif user_answer is not None:
-                if isinstance(user_answer, list):
-                    if str(value) in [str(x) for x in user_answer]:
-                        display = f"{option_text}  ✘ (Your Answer)"
-                else:
-                    if str(user_answer) == str(value):
-                        display = f"{option_text}  ✘ (Your Answer)"
+            option = getattr(widget, '_option', NO_OPTION)
             
-            if reference:
-                display += f"  → {reference}"
-            
-            bg_color = None
-            if is_correct:
-                bg_color = 'lightgreen'
-            elif user_answer is not None:
-                if isinstance(user_answer, list):
-                    if str(value) in [str(x) for x in user_answer]:
-                        bg_color = 'lightcoral'
-                elif str(user_answer) == str(value):
-                    bg_color = 'lightcoral'
+            if option.is_correct:
+                mark = MARKED_CORRECT
+            elif option.key in chosen:
+                mark = MARKED_WRONG
+            else:
+                mark = REVEALED
+            bg_color = ANSWER_COLORS[mark]
             
             try:
-                widget.configure(text=display, state='disabled')
+                widget.configure(text=option.texts[mark], state='disabled')
                 if bg_color:
                     widget.configure(bg=bg_color)
             except:
@@ -559,39 +795,35 @@ class CDMPQuizApp:
     
     def calculate_points(self, qid, user_selection):
         """Calculate points earned for an answer."""
-        correct = self.answers[(self.answers['qid'] == qid) & (self.answers['point'] == 1)]
+        correct_values, points_per_correct = self._correct_by_qid.get(qid, (frozenset(), 0.0))
         
-        if correct.empty:
+        if not correct_values:
             return 0.0
         
-        points_per_correct = 1.0 / len(correct)
-        
         if not user_selection or user_selection == '' or user_selection == 'NONE':
             return 0.0
         
         if isinstance(user_selection, list):
-            correct_values = set(correct['value'].astype(str))
-            selected_values = set(str(x) for x in user_selection)
-            matches = len(correct_values & selected_values)
+            matches = len(correct_values.intersection(map(str, user_selection)))
             return float(matches * points_per_correct)
         else:
-            correct_values = set(correct['value'].astype(str))
             return 1.0 if str(user_selection) in correct_values else 0.0
     
+    def get_user_answer(self, qid, latest=True):
+        """Get the user's latest (or first) recorded answer for a question."""
+        records = self._user_answers_by_qid.get(qid)
+        if not records:
+            return None
+        return records[-1 if latest else 0].get('answer')
+    
     def reveal_answer(self):
         """Show correct answers for current question."""
         if self.current_question_idx is None:
             return
         
-        qid = self.questions.iloc[self.current_question_idx]['qid']
+        qid = self.rendered_questions[self.current_question_idx].qid
         
-        user_answer = None
-        for record in reversed(self.user_answers):
-            if record.get('qid') == qid:
-                user_answer = record.get('answer')
-                break
-        
-        self.update_answer_display(qid, user_answer)
+        self.update_answer_display(qid, self.get_user_answer(qid))
         self.submit_btn.config(state='disabled')
     
     def update_timer(self):
@@ -599,14 +831,18 @@ class CDMPQuizApp:
         if not self.start_time:
             self.start_time = time.time()
         
-        elapsed = int(time.time() - self.start_time)
-        remaining = max(0, self.total_time - elapsed)
+        elapsed = time.time() - self.start_time
+        remaining = max(0, self.total_time - int(elapsed))
         
-        minutes, seconds = divmod(remaining, 60)
-        self.timer_label.config(text=f"Time: {minutes:02d}:{seconds:02d}")
+        # Only touch the label when the shown second actually changes
+        text = format_timer(remaining)
+        if text != self._timer_text:
+            self.timer_label.config(text=text)
+            self._timer_text = text
         
+        # Wake up on the next whole second since the start, so ticks never drift
         if remaining > 0 and not self.timer_expired and self.active:
-            self.master.after(1000, self.update_timer)
+            self.master.after(1000 - int(elapsed * 1000) % 1000, self.update_timer)
         else:
             if not self.timer_expired:
                 self.timer_expired = True
@@ -615,15 +851,11 @@ class CDMPQuizApp:
                     
                     if (self.current_question_idx is not None and
                         self.current_question_idx < len(self.questions)):
-                        qid = self.questions.iloc[self.current_question_idx]['qid']
-                        user_answer = None
-                        for record in reversed(self.user_answers):
-                            if record.get('qid') == qid:
-                                user_answer = record.get('answer')
-                                break
-                        self.update_answer_display(qid, user_answer)
+                        qid = self.rendered_questions[self.current_question_idx].qid
+                        self.update_answer_display(qid, self.get_user_answer(qid))
                     
                     self.active = False
+                    self.cancel_auto_advance()
                     self.review_btn.config(state='normal')
                     self.submit_btn.config(state='disabled')
                     self.skip_btn.config(state='disabled')
@@ -643,13 +875,8 @@ class CDMPQuizApp:
     
     def show_results_and_reset(self):
         """Display final results and reset to start screen."""
-        if self.user_answers:
-            results_df = pd.DataFrame(self.user_answers)
-            total_points = float(results_df['points'].sum())
-            attempted = len(results_df)
-        else:
-            total_points = 0.0
-            attempted = 0
+        total_points = float(sum(record['points'] for record in self.user_answers))
+        attempted = len(self.user_answers)
         
         total_questions = len(self.questions)
         chapter = self.get_selected_chapter()
@@ -666,7 +893,9 @@ class CDMPQuizApp:
     
     def reset_quiz_state(self):
         """Reset all quiz state variables."""
+        self.cancel_auto_advance()
         self.user_answers = []
+        self._user_answers_by_qid = {}
         self.current_index = 0
         self.current_question_idx = None
         self.question_start_time = None
@@ -676,10 +905,13 @@ class CDMPQuizApp:
         self.active = False
         self.review_mode = False
         self.questions = pd.DataFrame()
-        self.answers = pd.DataFrame()
+        self._answer_rows = {}
+        self._correct_by_qid = {}
+        self.rendered_questions = []
         self.clear_answer_widgets()
         self.question_label.config(text="Question will appear here")
-        self.timer_label.config(text="Time: 00:00")
+        self._timer_text = format_timer(0)
+        self.timer_label.config(text=self._timer_text)
         self.status_label.config(text="")
     
     def show_start_screen(self):
@@ -712,37 +944,25 @@ class CDMPQuizApp:
     
     def load_review_question(self):
         """Load next question in review mode."""
-        self.clear_answer_widgets()
-        
         if self.review_index < len(self.questions):
-            question = self.questions.iloc[self.review_index]
-            qid = question.get('qid')
-            qtype = question.get('type', 'single')
+            question = self.rendered_questions[self.review_index]
+            qid = question.qid
+            qtype = question.qtype
             
-            chapter = self.get_selected_chapter()
-            header = f"Chapter: {chapter}   |   QID: {qid}   ({self.review_index + 1} of {len(self.questions)})\n\n"
-            self.question_label.config(text=header + str(question.get('question', '')))
+            self.question_label.config(text=question.text)
             
-            user_answer = None
-            for record in self.user_answers:
-                if record.get('qid') == qid:
-                    user_answer = record.get('answer')
-                    break
+            user_answer = self.get_user_answer(qid, latest=False)
             
             self.display_answers(qid, qtype, show_correct=True, user_response=user_answer)
             self.review_index += 1
         else:
+            self.clear_answer_widgets()
             messagebox.showinfo("Review Complete", "End of review.")
             self.review_mode = False
     
-    def handle_keypress(self, event):
+    def select_answer(self, idx):
         """Handle keyboard shortcuts (1-9 for answer selection)."""
-        key = event.char.strip()
-        if not key.isdigit():
-            return
-        
-        idx = int(key) - 1
-        if idx < 0 or idx >= len(self.answer_widgets):
+        if idx >= len(self.answer_widgets):
             return
         
         try:
@@ -754,167 +974,338 @@ class CDMPQuizApp:
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
+def rows_to_frame(rows, usecols=None):
+    """Build a dataframe from sheet rows (first row is the header)."""
+    load_data_libraries()
+    
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    
+    columns = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+    data = [list(row) for row in rows]
+    
+    # Match read_excel: keep blank rows inside the data, drop trailing ones
+    while data and all(cell is None for cell in data[-1]):
+        data.pop()
+    
+    # Rows end at their last filled cell, so pad them (and the header) to one width
+    width = max(len(columns), max(map(len, data), default=0))
+    columns += [f"Unnamed: {i}" for i in range(len(columns), width)]
+    for row in data:
+        if len(row) < width:
+            row.extend([None] * (width - len(row)))
+    
+    # Like read_excel's callable usecols: keep only headers the predicate accepts
+    if usecols is not None:
+        keep = [i for i, name in enumerate(columns) if usecols(name)]
+        if len(keep) < len(columns):
+            columns = [columns[i] for i in keep]
+            data = [[row[i] for i in keep] for row in data]
+    
+    return pd.DataFrame(data, columns=columns).infer_objects()
+
+def read_sheet(worksheet, usecols=None):
+    """Stream a read-only openpyxl worksheet into a dataframe."""
+    # The stored <dimension> record can be wrong; without this rows beyond it are dropped
+    worksheet.reset_dimensions()
+    return rows_to_frame(worksheet.iter_rows(values_only=True), usecols)
+
+def read_workbook_sheet(filepath, name, usecols=None):
+    """Read one sheet with openpyxl, opening and closing the workbook around it."""
+    from openpyxl import load_workbook
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        return read_sheet(wb[name], usecols)
+    finally:
+        wb.close()
+
+def clean_calamine_cell(value):
+    """Convert a calamine cell to the value openpyxl would return."""
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def read_calamine_sheet(sheet, usecols=None):
+    """Read a calamine worksheet into a dataframe."""
+    return rows_to_frame(([clean_calamine_cell(v) for v in row] for row in sheet.to_python()), usecols)
+
+def is_combined_column(name):
+    """Check whether a header belongs to the single-sheet format."""
+    return isinstance(name, str) and name.strip().lower() in COMBINED_HEADERS
+
+def open_workbook(filepath):
+    """Open a workbook with the fastest reader: (workbook, sheet names, sheet reader)."""
+    # Readers are imported here: a launch served from the cache never needs them
+    try:
+        from python_calamine import CalamineWorkbook  # optional, much faster reader
+        wb = CalamineWorkbook.from_path(filepath)
+    except Exception:
+        # Not installed, or a workbook calamine cannot parse: use openpyxl streaming
+        from openpyxl import load_workbook
+        wb = load_workbook(filepath, read_only=True, data_only=True)
+        return wb, wb.sheetnames, lambda name, usecols=None: read_sheet(wb[name], usecols)
+    
+    def read(name, usecols=None):
+        try:
+            return read_calamine_sheet(wb.get_sheet_by_name(name), usecols)
+        except Exception:
+            # calamine can also fail converting a sheet it opened: reread that one with openpyxl
+            return read_workbook_sheet(filepath, name, usecols)
+    
+    return wb, wb.sheet_names, read
+
 def load_excel_data(filepath):
     """Load and parse Excel file into questions and answers dataframes."""
+    load_data_libraries()
+    
     try:
-        xls = pd.ExcelFile(filepath, engine='openpyxl')
+        wb, sheet_names, read = open_workbook(filepath)
     except Exception as e:
         raise Exception(f"Error opening Excel file: {e}")
     
-    sheet_names_lower = [s.lower() for s in xls.sheet_names]
-    
-    if 'ques' in sheet_names_lower and 'ans' in sheet_names_lower:
-        ques_sheet = [s for s in xls.sheet_names if s.lower() == 'ques'][0]
-        ans_sheet = [s for s in xls.sheet_names if s.lower() == 'ans'][0]
-        
-        questions = pd.read_excel(xls, sheet_name=ques_sheet, engine='openpyxl')
-        answers = pd.read_excel(xls, sheet_name=ans_sheet, engine='openpyxl')
-    else:
-        first_sheet = xls.sheet_names[0]
-        raw_data = pd.read_excel(xls, sheet_name=first_sheet, engine='openpyxl')
-        
-        questions, answers = parse_combined_format(raw_data)
+    try:
+        # First sheet wins when several names differ only in case
+        name_map = {}
+        for name in sheet_names:
+            name_map.setdefault(name.lower(), name)
+        
+        if 'ques' in name_map and 'ans' in name_map:
+            questions = read(name_map['ques'], usecols=QUES_COLUMNS.__contains__)
+            answers = read(name_map['ans'], usecols=ANS_COLUMNS.__contains__)
+        else:
+            first_sheet = sheet_names[0]
+            raw_data = read(first_sheet, usecols=is_combined_column)
+            
+            questions, answers = parse_combined_format(raw_data)
+    finally:
+        wb.close()
     
     questions = normalize_questions(questions)
     answers = normalize_answers(answers)
+    share_qid_categories(questions, answers)
     
     return questions, answers
 
+def group_answer_rows(answers):
+    """Map each qid to the row positions of its answers."""
+    return answers.groupby('qid', sort=False, observed=True).indices
+
+def get_cache_path(filepath):
+    """Get the cache file used for a workbook (one per workbook path)."""
+    digest = hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, digest[:16] + ".pkl")
+
+def load_or_cache_quiz_data(filepath):
+    """Load quiz data and its qid index, reusing the pickle cache while the workbook is unchanged."""
+    load_data_libraries()
+    stat = os.stat(filepath)
+    # Parser and pandas versions are part of the key: either can change what gets pickled
+    cache_key = (CACHE_VERSION, pd.__version__, stat.st_mtime_ns, stat.st_size)
+    cache_path = get_cache_path(filepath)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            key, questions, answers, answer_rows_by_qid = pickle.load(f)
+        if key == cache_key:
+            return questions, answers, answer_rows_by_qid
+    except Exception:
+        pass
+    
+    questions, answers = load_excel_data(filepath)
+    answer_rows_by_qid = group_answer_rows(answers)
+    
+    # Write to a temporary file first so a crash never leaves a truncated cache
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump((cache_key, questions, answers, answer_rows_by_qid), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        # The cache is only an optimization: a failed write (disk full, unpicklable
+        # data, ...) must neither fail the load nor leave its partial file behind
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    
+    return questions, answers, answer_rows_by_qid
+
 def parse_combined_format(raw_df):
     """Parse combined format Excel (single sheet with all data)."""
-    cols = {c.strip().lower(): c for c in raw_df.columns}
+    load_data_libraries()
+    
+    # Columns are resolved to positions once; iloc never hashes a header label again
+    positions = {c.strip().lower(): i for i, c in enumerate(raw_df.columns)}
     
     def find_column(variants):
         for var in variants:
-            if var.lower() in cols:
-                return cols[var.lower()]
+            if var.lower() in positions:
+                return positions[var.lower()]
         return None
     
-    col_chapter = find_column(['KnowledgeArea', 'Knowledge Area', 'knowledgearea'])
-    col_qnum = find_column(['Question Number', 'QuestionNumber', 'QNumber'])
-    col_question = find_column(['Question', 'question'])
-    col_correct = find_column(['Correct', 'correct', 'Answer'])
-    col_section = find_column(['DMBOK Section', 'DMBOKSection'])
-    col_page = find_column(['DMBOK Page', 'DMBOKPage'])
+    col_chapter = find_column(COMBINED_COLUMNS['chapter'])
+    col_qnum = find_column(COMBINED_COLUMNS['qnum'])
+    col_question = find_column(COMBINED_COLUMNS['question'])
+    col_correct = find_column(COMBINED_COLUMNS['correct'])
+    col_section = find_column(COMBINED_COLUMNS['section'])
+    col_page = find_column(COMBINED_COLUMNS['page'])
     
     col_options = {}
     for letter in ['A', 'B', 'C', 'D', 'E']:
-        col_options[letter] = find_column([letter, f'{letter}.', letter.lower()])
+        col_options[letter] = find_column(COMBINED_COLUMNS[letter])
     
-    questions_list = []
-    answers_list = []
+    def column(pos, default=None):
+        """Get a column as a series, or a constant series when it is absent."""
+        if pos is not None:
+            return raw_df.iloc[:, pos]
+        return pd.Series(default, index=raw_df.index, dtype=object)
     
-    for idx, row in raw_df.iterrows():
-        if col_qnum and pd.notna(row.get(col_qnum)):
-            qid = str(row.get(col_qnum)).strip()
-        else:
-            qid = f"Q{idx + 1}"
-        
-        if col_chapter and pd.notna(row.get(col_chapter)):
-            chapter = normalize_chapter_name(row.get(col_chapter))
-        elif col_section and pd.notna(row.get(col_section)):
-            chapter = normalize_chapter_name(row.get(col_section))
-        else:
-            chapter = "Unspecified"
-        
-        question_text = row.get(col_question) if col_question else ""
-        if pd.isna(question_text):
-            question_text = ""
-        
-        correct_letters = extract_correct_letters(row.get(col_correct)) if col_correct else []
-        question_type = 'single' if len(correct_letters) <= 1 else 'multiple'
-        
-        ref_parts = []
-        if col_section and pd.notna(row.get(col_section)):
-            ref_parts.append(str(row.get(col_section)).strip())
-        if col_page and pd.notna(row.get(col_page)):
-            ref_parts.append(str(row.get(col_page)).strip())
-        reference = " | ".join(ref_parts) if ref_parts else ""
-        
-        questions_list.append({
-            'qid': qid,
-            'chapter': chapter,
-            'question': str(question_text),
-            'type': question_type
-        })
-        
-        for letter in ['A', 'B', 'C', 'D', 'E']:
-            col_name = col_options.get(letter)
-            if not col_name:
-                continue
-            
-            option_text = row.get(col_name)
-            if pd.isna(option_text) or str(option_text).strip() == "":
-                continue
-            
-            is_correct = 1 if letter in correct_letters else 0
-            
-            answers_list.append({
-                'qid': qid,
-                'options': str(option_text),
-                'value': letter,
-                'point': is_correct,
-                'randomize': 1,
-                'ref': reference
-            })
+    def stripped_text(series):
+        """Stringify and strip the non-missing cells of a column."""
+        present = series.notna()
+        return present, series.where(present, "").astype(str).str.strip()
     
-    return pd.DataFrame(questions_list), pd.DataFrame(answers_list)
+    qnum_present, qnum_text = stripped_text(column(col_qnum))
+    default_qids = ("Q" + (raw_df.index + 1).astype(str)).to_numpy(object)
+    qids = qnum_text.where(qnum_present, default_qids).to_numpy(object)
+    
+    # Chapter falls back to the DMBOK section; the cached normalizer handles repeats
+    section = column(col_section)
+    chapter_source = column(col_chapter)
+    chapter_source = chapter_source.where(chapter_source.notna(), section)
+    # NaN never hits the cache (each one hashes differently), so it skips the call
+    chapters = chapter_source.map(normalize_chapter_name, na_action='ignore').fillna("Unspecified")
+    
+    question_texts = column(col_question, "").fillna("").map(str)
+    
+    if col_correct is not None:
+        # Answer keys repeat ("A", "B", ...), so each distinct cell is parsed once
+        correct_bits = (column(col_correct).map(extract_correct_bits, na_action='ignore')
+                        .fillna(0).to_numpy(dtype=np.int64))
+    else:
+        correct_bits = np.zeros(len(raw_df), dtype=np.int64)
+    # At most one bit set means a single-answer question
+    question_types = np.where(correct_bits & (correct_bits - 1) == 0, 'single', 'multiple')
+    
+    section_present, section_text = stripped_text(section)
+    page_present, page_text = stripped_text(column(col_page))
+    references = np.select(
+        [section_present & page_present, section_present, page_present],
+        [section_text + " | " + page_text, section_text, page_text],
+        ""
+    ).astype(object)
+    
+    questions = pd.DataFrame({
+        'qid': qids,
+        'chapter': chapters.to_numpy(object),
+        'question': question_texts.to_numpy(object),
+        'type': question_types.astype(object)
+    }, copy=False)
+    
+    option_bits = np.array([bit for bit, letter in enumerate(['A', 'B', 'C', 'D', 'E'])
+                            if col_options[letter] is not None], dtype=np.int64)
+    if not len(option_bits):
+        return questions, pd.DataFrame()
+    
+    # All option columns stacked into one flat series, row by row, so the
+    # filled cells come out already in row-then-letter order, as the sheet reads
+    option_positions = [col_options[letter] for letter in np.array(['A', 'B', 'C', 'D', 'E'])[option_bits]]
+    option_cells = raw_df.iloc[:, option_positions].to_numpy(object).ravel()
+    option_present, option_stripped = stripped_text(pd.Series(option_cells, dtype=object))
+    filled = np.flatnonzero((option_present & (option_stripped != "")).to_numpy())
+    rows, slots = np.divmod(filled, len(option_bits))
+    bits = option_bits[slots]
+    
+    answers = pd.DataFrame({
+        'qid': qids[rows],
+        'options': [str(text) for text in option_cells[filled]],
+        'value': np.array(['A', 'B', 'C', 'D', 'E'], dtype=object)[bits],
+        'point': (correct_bits[rows] >> bits) & 1,
+        'randomize': 1,
+        'ref': references[rows]
+    }, copy=False)
+    
+    return questions, answers
 
 def normalize_questions(df):
     """Ensure questions dataframe has required columns."""
+    load_data_libraries()
+    
     if 'chapter' not in df.columns:
         df['chapter'] = ''
-    df['chapter'] = df['chapter'].fillna('').astype(str).apply(normalize_chapter_name)
+    df['chapter'] = normalize_chapter_series(df['chapter']).astype('category')
     
     if 'type' not in df.columns:
         df['type'] = 'single'
-    df['type'] = df['type'].fillna('single').astype(str).str.strip()
+    # Only 'single'/'multiple' in practice, so a categorical stores one code per row
+    df['type'] = df['type'].fillna('single').astype(str).str.strip().astype('category')
     
     if 'qid' not in df.columns:
-        df['qid'] = [f"Q{i+1}" for i in range(len(df))]
+        df['qid'] = ("Q" + pd.RangeIndex(1, len(df) + 1).astype(str)).to_numpy(object)
     
     return df
 
 def normalize_answers(df):
     """Ensure answers dataframe has required columns."""
-    for col in ['qid', 'options', 'value', 'point', 'randomize', 'ref']:
-        if col not in df.columns:
-            df[col] = None
+    load_data_libraries()
     
-    try:
-        df['point'] = df['point'].fillna(0).astype(int)
-    except:
-        df['point'] = df['point'].fillna(0).apply(
-            lambda x: int(float(x)) if pd.notna(x) and str(x).replace('.', '', 1).isdigit() else 0
-        )
+    missing = [col for col in ['qid', 'options', 'value', 'point', 'randomize', 'ref']
+               if col not in df.columns]
+    if missing:
+        df = df.assign(**dict.fromkeys(missing))
+    
+    # The single-sheet parser already emits integer points; only other input needs coercing
+    points = df['point']
+    if not pd.api.types.is_integer_dtype(points):
+        # Unparseable and non-finite points count as 0; fractions truncate like int()
+        points = pd.to_numeric(points, errors='coerce').astype('float64')
+        points = points.where(np.isfinite(points), 0).astype('int64')
+    df['point'] = pd.to_numeric(points, downcast='integer')
     
     return df
 
+def share_qid_categories(questions, answers):
+    """Store qids in both tables as one categorical so they compare as int codes."""
+    load_data_libraries()
+    
+    # Question qids come first so their spelling wins (e.g. 1 over 1.0)
+    qids = dict.fromkeys(questions['qid'].dropna().tolist())
+    qids.update(dict.fromkeys(answers['qid'].dropna().tolist()))
+    dtype = pd.CategoricalDtype(list(qids))
+    questions['qid'] = questions['qid'].astype(dtype)
+    answers['qid'] = answers['qid'].astype(dtype)
+
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
 
 def main():
     """Main entry point for the application."""
-    set_working_directory()
+    # One Tk root serves both the error dialogs and the app; it stays hidden until needed
+    root = tk.Tk()
+    root.withdraw()
     
-    if not os.path.exists(EXCEL_FILE):
-        root = tk.Tk()
-        root.withdraw()
+    if not os.path.exists(EXCEL_PATH):
         messagebox.showerror("File Not Found",
-                           f"Could not find '{EXCEL_FILE}' in {os.getcwd()}")
+                           f"Could not find '{EXCEL_FILE}' in {SCRIPT_DIR}", parent=root)
+        root.destroy()
         return
     
     try:
-        questions, answers = load_excel_data(EXCEL_FILE)
+        questions, answers, answer_rows_by_qid = load_or_cache_quiz_data(EXCEL_PATH)
     except Exception as e:
-        root = tk.Tk()
-        root.withdraw()
-        messagebox.showerror("Load Error", str(e))
+        messagebox.showerror("Load Error", str(e), parent=root)
+        root.destroy()
         return
     
-    root = tk.Tk()
-    app = CDMPQuizApp(root, questions, answers)
+    root.deiconify()
+    app = CDMPQuizApp(root, questions, answers, answer_rows_by_qid)
     root.mainloop()
 
 if __name__ == "__main__":